@@ -2,57 +2,96 @@
 import argparse
 import json
 import os
+import secrets
+import select
 import shlex
 import shutil
+import signal
+import stat as stat_module
 import subprocess
 import sys
 import time
-import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 try:
-    import yaml  # type: ignore
+    import orjson  # type: ignore
 except ImportError:
-    yaml = None
+    orjson = None
+
+_yaml = False
+
+
+def _yaml_module():
+    # PyYAML is the heaviest import on the CLI startup path and is only
+    # needed on a config-cache miss; load it lazily.
+    global _yaml
+    if _yaml is False:
+        try:
+            import yaml  # type: ignore
+
+            _yaml = yaml
+        except ImportError:
+            _yaml = None
+    return _yaml
 
 
 def run(cmd, cwd=None):
-    return subprocess.run(cmd, cwd=cwd, shell=True, check=False)
+    # argv lists exec directly; only string commands pay the /bin/sh fork.
+    return subprocess.run(cmd, cwd=cwd, shell=isinstance(cmd, str), check=False)
 
 
+@lru_cache(maxsize=None)
 def resolve_path(value, base: Path) -> Path:
     path = value if isinstance(value, Path) else Path(value)
     if not path.is_absolute():
         path = base / path
+    # resolve() walks every component for symlinks; an absolute path with no
+    # '..' segments is already usable as-is.
+    if ".." not in path.parts:
+        return path
     return path.resolve()
 
 
+def stat_or_none(path: Path):
+    # One stat call answers exists/is_dir/is_file together; Path.exists()
+    # chains re-stat the same path for every question.
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def write_pause_marker(path: Path, reason: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(f"paused_at: {iso_ts(time.time())}\nreason: {reason}\n", encoding="utf-8")
 
 
+def _find_git_marker(path: Path) -> Optional[Path]:
+    # A work tree is marked by a `.git` directory (main checkout) or a
+    # `.git` file (linked worktree); checking for it directly avoids a git
+    # subprocess fork per query.
+    try:
+        path = path.resolve()
+    except OSError:
+        return None
+    for candidate in (path, *path.parents):
+        marker = candidate / ".git"
+        if marker.exists():
+            return marker
+    return None
+
+
 def is_git_repo(path: Path) -> bool:
-    res = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--git-dir"],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        check=False,
-    )
-    return res.returncode == 0
+    return _find_git_marker(path) is not None
 
 
 def is_git_worktree(path: Path) -> bool:
-    res = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        check=False,
-    )
-    return res.returncode == 0
+    return _find_git_marker(path) is not None
 
 
+@lru_cache(maxsize=None)
 def get_git_common_dir(path: Path) -> Optional[Path]:
     res = subprocess.run(
         ["git", "-C", str(path), "rev-parse", "--git-common-dir"],
@@ -82,7 +121,46 @@ def is_same_git_repo(project_root: Path, worktree_path: Path) -> bool:
     return project_common == worktree_common
 
 
+def _read_git_head_commit(project_root: Path) -> Optional[str]:
+    # Resolve HEAD by reading the ref files directly; a git subprocess is
+    # only needed for layouts this doesn't understand.
+    try:
+        git_dir = project_root / ".git"
+        if git_dir.is_file():
+            content = git_dir.read_text(encoding="utf-8", errors="ignore")
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = Path(content.split(":", 1)[1].strip())
+            if not git_dir.is_absolute():
+                git_dir = (project_root / git_dir).resolve()
+        head = (git_dir / "HEAD").read_text(encoding="utf-8", errors="ignore").strip()
+        if not head.startswith("ref:"):
+            return head if len(head) >= 40 else None
+        ref = head.split(":", 1)[1].strip()
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            value = commondir_file.read_text(encoding="utf-8", errors="ignore").strip()
+            common_dir = Path(value)
+            if not common_dir.is_absolute():
+                common_dir = (git_dir / common_dir).resolve()
+        loose = common_dir / ref
+        if loose.is_file():
+            return loose.read_text(encoding="utf-8", errors="ignore").strip()
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text(encoding="utf-8", errors="ignore").splitlines():
+                if line.endswith(" " + ref):
+                    return line.split(" ", 1)[0]
+    except OSError:
+        return None
+    return None
+
+
 def get_git_commit(project_root: Path) -> str:
+    sha = _read_git_head_commit(project_root)
+    if sha:
+        return sha
     res = subprocess.run(
         ["git", "-C", str(project_root), "rev-parse", "HEAD"],
         stdout=subprocess.PIPE,
@@ -96,6 +174,24 @@ def get_git_commit(project_root: Path) -> str:
 
 
 def branch_exists(project_root: Path, branch: str) -> bool:
+    # Local branches live as loose files under refs/heads or in packed-refs;
+    # answer from the filesystem and only fork git for exotic ref storage.
+    common_dir = get_git_common_dir(project_root)
+    if common_dir is not None and not (common_dir / "reftable").exists():
+        if (common_dir / "refs" / "heads" / branch).is_file():
+            return True
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            try:
+                suffix = f" refs/heads/{branch}"
+                for line in packed.read_text(
+                    encoding="utf-8", errors="ignore"
+                ).splitlines():
+                    if line.endswith(suffix):
+                        return True
+            except OSError:
+                pass
+        return False
     res = subprocess.run(
         ["git", "-C", str(project_root), "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"],
         stdout=subprocess.DEVNULL,
@@ -105,6 +201,7 @@ def branch_exists(project_root: Path, branch: str) -> bool:
     return res.returncode == 0
 
 
+@lru_cache(maxsize=None)
 def get_framework_version(project_root: Path) -> str:
     version_file = project_root / "framework" / "VERSION"
     if version_file.exists():
@@ -114,23 +211,65 @@ def get_framework_version(project_root: Path) -> str:
     return get_git_commit(project_root)
 
 
+_EVENT_LOGS = {}
+
+
+def dump_json_line(payload: dict) -> str:
+    # orjson serializes several times faster than the stdlib; the event log
+    # is UTF-8 either way, so ensure_ascii escaping buys nothing.
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
+
 def write_event(path: Path, payload: dict):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, ensure_ascii=True) + "\n")
+    # Keep the JSONL handle open across events; the scheduler flushes once
+    # per tick instead of paying an open/append/close per event.
+    f = _EVENT_LOGS.get(path)
+    if f is None or f.closed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = path.open("a", encoding="utf-8")
+        _EVENT_LOGS[path] = f
+    f.write(dump_json_line(payload) + "\n")
+
+
+def flush_events() -> None:
+    for f in _EVENT_LOGS.values():
+        if not f.closed:
+            f.flush()
+
+
+_iso_ts_last = (None, "")
 
 
 def iso_ts(epoch: float) -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(epoch))
+    # Timestamps have whole-second resolution; cache the last formatted
+    # second so event bursts skip the strftime/localtime pair.
+    global _iso_ts_last
+    second = int(epoch)
+    if second != _iso_ts_last[0]:
+        _iso_ts_last = (
+            second,
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(epoch)),
+        )
+    return _iso_ts_last[1]
 
 
 def format_duration(seconds: float) -> str:
     total = int(seconds)
+    if total < 3600:
+        return f"{total // 60:02d}:{total % 60:02d}"
     minutes, sec = divmod(total, 60)
     hours, minutes = divmod(minutes, 60)
-    if hours:
-        return f"{hours:02d}:{minutes:02d}:{sec:02d}"
-    return f"{minutes:02d}:{sec:02d}"
+    return f"{hours:02d}:{minutes:02d}:{sec:02d}"
+
+
+@lru_cache(maxsize=None)
+def _format_template_cached(value: str, items: tuple) -> str:
+    try:
+        return value.format(**dict(items))
+    except KeyError as exc:
+        raise RuntimeError(f"Unknown template key {exc} in value: {value}") from exc
 
 
 def format_template(value, **kwargs):
@@ -140,10 +279,11 @@ def format_template(value, **kwargs):
         value = str(value)
     if not isinstance(value, str):
         return value
-    try:
-        return value.format(**kwargs)
-    except KeyError as exc:
-        raise RuntimeError(f"Unknown template key {exc} in value: {value}") from exc
+    # Skip formatting only for brace-free values: even a field-free
+    # template is not a no-op when it uses the {{ / }} escapes.
+    if "{" not in value and "}" not in value:
+        return value
+    return _format_template_cached(value, tuple(sorted(kwargs.items())))
 
 
 def ensure_worktree(project_root: Path, worktree_path: Path, branch: str):
@@ -159,8 +299,7 @@ def ensure_worktree(project_root: Path, worktree_path: Path, branch: str):
             )
         return
     if branch_exists(project_root, branch):
-        cmd = f"git worktree add {worktree_path} {branch}"
-        res = run(cmd, cwd=project_root)
+        res = run(["git", "worktree", "add", str(worktree_path), branch], cwd=project_root)
         if res.returncode != 0:
             raise RuntimeError(
                 "Failed to create worktree from existing branch. "
@@ -168,22 +307,73 @@ def ensure_worktree(project_root: Path, worktree_path: Path, branch: str):
             )
         return
 
-    cmd = f"git worktree add -b {branch} {worktree_path}"
-    res = run(cmd, cwd=project_root)
+    res = run(["git", "worktree", "add", "-b", branch, str(worktree_path)], cwd=project_root)
     if res.returncode != 0:
-        cmd = f"git worktree add {worktree_path} {branch}"
-        res = run(cmd, cwd=project_root)
+        res = run(["git", "worktree", "add", str(worktree_path), branch], cwd=project_root)
     if res.returncode != 0:
         raise RuntimeError(f"Failed to create worktree: {worktree_path}")
 
 
+def _yaml_safe_load(stream):
+    # Prefer the libyaml-backed loader when PyYAML was built with it; it
+    # parses an order of magnitude faster than the pure-Python SafeLoader.
+    yaml = _yaml_module()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def _config_cache_key(path: Path) -> Optional[str]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_config_cache(path: Path, key: Optional[str]):
+    if key is None:
+        return None
+    cache_path = path.with_name(path.name + ".cache.json")
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            if f.readline().rstrip("\n") != key:
+                return None
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_config_cache(path: Path, key: Optional[str], cfg) -> None:
+    if key is None:
+        return
+    cache_path = path.with_name(path.name + ".cache.json")
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.write(key + "\n")
+            json.dump(cfg, f, ensure_ascii=True)
+        tmp_path.replace(cache_path)
+    except (OSError, TypeError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def load_config(path: Path):
     suffix = path.suffix.lower()
     if suffix == ".json":
         with path.open("r", encoding="utf-8") as f:
             return json.load(f) or {}
     if suffix in (".yml", ".yaml"):
-        if yaml is None:
+        # YAML parsing dominates startup; keep a JSON sidecar keyed by
+        # (path, mtime, size) and reuse it while the config is unchanged.
+        # Cache hits return before PyYAML is even imported.
+        cache_key = _config_cache_key(path)
+        cached = _read_config_cache(path, cache_key)
+        if cached is not None:
+            return cached
+        if _yaml_module() is None:
             fallback = path.with_suffix(".json")
             if fallback.exists():
                 return load_config(fallback)
@@ -192,8 +382,10 @@ def load_config(path: Path):
                 f"Install PyYAML or use JSON config: {fallback}"
             )
         with path.open("r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f)
-        return cfg or {}
+            cfg = _yaml_safe_load(f)
+        cfg = cfg or {}
+        _write_config_cache(path, cache_key, cfg)
+        return cfg
     # Unknown suffix: try JSON then YAML
     if path.exists():
         try:
@@ -201,10 +393,10 @@ def load_config(path: Path):
                 return json.load(f) or {}
         except json.JSONDecodeError:
             pass
-    if yaml is None:
+    if _yaml_module() is None:
         raise RuntimeError(f"Unsupported config format: {path}")
     with path.open("r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+        cfg = _yaml_safe_load(f)
     return cfg or {}
 
 
@@ -245,24 +437,41 @@ def normalize_tasks(tasks):
 
 
 def select_tasks(tasks, phase: str, include_manual: bool):
+    selected_names = {
+        task["name"]
+        for task in tasks
+        if task.get("phase", "main") == phase
+        and (include_manual or not task.get("manual", False))
+    }
     selected = []
-    selected_names = set()
     for task in tasks:
-        if task.get("phase", "main") != phase:
-            continue
-        if task.get("manual", False) and not include_manual:
+        if task["name"] not in selected_names:
             continue
-        selected.append(task)
-        selected_names.add(task["name"])
-    for task in selected:
         missing = [dep for dep in task["depends_on"] if dep not in selected_names]
         if missing:
             raise RuntimeError(
                 f"Task '{task['name']}' depends on excluded tasks: {', '.join(missing)}"
             )
+        selected.append(task)
     return selected
 
 
+_SHELL_META = set(";|&<>()`$*?~{}[]#!\n")
+
+
+def command_argv(command: str):
+    """Return an argv list when the command needs no shell, else None."""
+    if any(ch in _SHELL_META for ch in command):
+        return None
+    try:
+        argv = shlex.split(command, posix=True)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
 def build_command(runners, task, prompt_path: Path):
     runner_name = task.get("runner", "codex")
     if runner_name not in runners:
@@ -277,22 +486,29 @@ def preflight(project_root: Path, logs_dir: Path, runners: dict, tasks: list, ph
     if shutil.which("git") is None:
         errors.append("git is not available on PATH")
 
-    # ensure logs dir writable
+    # ensure logs dir writable; an access check covers what the old
+    # probe-file write/unlink round-trip did without touching the disk
     try:
         logs_dir.mkdir(parents=True, exist_ok=True)
-        probe = logs_dir / ".write_probe"
-        probe.write_text("ok", encoding="utf-8")
-        probe.unlink(missing_ok=True)
+        if not os.access(logs_dir, os.W_OK | os.X_OK):
+            errors.append(f"logs_dir is not writable: {logs_dir}")
     except Exception as exc:  # noqa: BLE001
         errors.append(f"logs_dir is not writable: {logs_dir} ({exc})")
 
-    # check binaries only for runners used by selected tasks
+    # One pass gathers everything the later checks need: the phase's tasks,
+    # the runners they use and the prompt paths to stat.
+    phase_tasks = []
     required_runners = set()
+    prompt_paths = set()
     for task in tasks:
         if task.get("phase", "main") != phase:
             continue
+        phase_tasks.append(task)
         required_runners.add(task.get("runner", "codex"))
+        prompt_paths.add(resolve_path(task["prompt"], project_root))
 
+    # check binaries only for runners used by selected tasks
+    runner_binaries = {}
     for name in sorted(required_runners):
         cfg = runners.get(name)
         if not cfg:
@@ -309,17 +525,32 @@ def preflight(project_root: Path, logs_dir: Path, runners: dict, tasks: list, ph
             continue
         if first in {"bash", "sh", "zsh"}:
             continue
-        if shutil.which(first) is None:
-            errors.append(f"Runner '{name}' binary not found on PATH: {first}")
+        runner_binaries[name] = first
+
+    # PATH lookups and prompt stats hit the filesystem independently per
+    # entry; issue them together so preflight pays one round of I/O latency.
+    stat_cache = {}
+    if runner_binaries or prompt_paths:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            which_results = dict(
+                zip(
+                    runner_binaries,
+                    ex.map(shutil.which, runner_binaries.values()),
+                )
+            )
+            stat_cache = dict(zip(prompt_paths, ex.map(stat_or_none, prompt_paths)))
+        for name, first in runner_binaries.items():
+            if which_results.get(name) is None:
+                errors.append(f"Runner '{name}' binary not found on PATH: {first}")
 
     # check tasks: prompt exists, worktree path is free or a git worktree
     preflight_run_id = "preflight"
     worktrees_seen = {}
     branches_seen = {}
     logs_seen = {}
-    for task in tasks:
-        if task.get("phase", "main") != phase:
-            continue
+    for task in phase_tasks:
         if task.get("interactive") and not sys.stdin.isatty():
             errors.append(f"Interactive task '{task['name']}' requires a TTY")
         runner_name = task.get("runner", "codex")
@@ -353,19 +584,23 @@ def preflight(project_root: Path, logs_dir: Path, runners: dict, tasks: list, ph
             )
         else:
             branches_seen[branch_value] = task["name"]
-        if worktree.exists() and not is_git_worktree(worktree):
-            errors.append(
-                f"Worktree path exists and is not a git worktree: {worktree}"
-            )
-        elif worktree.exists() and not is_same_git_repo(project_root, worktree):
-            errors.append(
-                "Worktree path exists but belongs to a different git repository: "
-                f"{worktree}"
-            )
+        if stat_or_none(worktree) is not None:
+            if not is_git_worktree(worktree):
+                errors.append(
+                    f"Worktree path exists and is not a git worktree: {worktree}"
+                )
+            elif not is_same_git_repo(project_root, worktree):
+                errors.append(
+                    "Worktree path exists but belongs to a different git repository: "
+                    f"{worktree}"
+                )
         prompt_path = resolve_path(task["prompt"], project_root)
-        if not prompt_path.exists():
+        prompt_st = stat_cache.get(prompt_path, None)
+        if prompt_st is None and prompt_path not in stat_cache:
+            prompt_st = stat_or_none(prompt_path)
+        if prompt_st is None:
             errors.append(f"Prompt file not found: {prompt_path}")
-        elif prompt_path.is_dir():
+        elif stat_module.S_ISDIR(prompt_st.st_mode):
             errors.append(f"Prompt path is a directory: {prompt_path}")
         log_value = task.get("log")
         if log_value:
@@ -385,7 +620,8 @@ def preflight(project_root: Path, logs_dir: Path, runners: dict, tasks: list, ph
             )
         else:
             logs_seen[log_key] = task["name"]
-        if log_path.exists() and log_path.is_dir():
+        log_st = stat_or_none(log_path)
+        if log_st is not None and stat_module.S_ISDIR(log_st.st_mode):
             errors.append(f"Log path is a directory: {log_path}")
 
     if errors:
@@ -457,7 +693,7 @@ def main():
     blocked = {}
     paused_tasks = set()
 
-    run_id = time.strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:8]
+    run_id = time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(4)
     run_started_at = time.time()
     framework_version = get_framework_version(project_root)
     events_path = logs_dir / "framework-run.jsonl"
@@ -497,77 +733,180 @@ def main():
         },
     )
 
-    def can_start(task):
-        return all(dep in completed and completed[dep] == 0 for dep in task["depends_on"])
+    # Indegree scheduling: each task carries its unmet-dependency count and a
+    # reverse-adjacency list, so completions enqueue newly runnable tasks in
+    # O(dependents) instead of rescanning every task per tick.
+    task_by_name = {task["name"]: task for task in tasks}
+    dependents = {name: [] for name in task_by_name}
+    pending_deps = {}
+    for task in tasks:
+        pending_deps[task["name"]] = len(task["depends_on"])
+        for dep in task["depends_on"]:
+            dependents[dep].append(task["name"])
+    ready_queue = [task["name"] for task in tasks if not pending_deps[task["name"]]]
+
+    def block_task(name):
+        failed_deps = [
+            dep
+            for dep in task_by_name[name]["depends_on"]
+            if dep in blocked or (dep in completed and completed[dep] != 0)
+        ]
+        blocked[name] = failed_deps
+        print(f"[BLOCKED] {name} <- {', '.join(failed_deps)}")
+        write_event(
+            events_path,
+            {
+                "event": "task_blocked",
+                "run_id": run_id,
+                "task": name,
+                "timestamp": iso_ts(time.time()),
+                "deps": failed_deps,
+            },
+        )
+        for child in dependents[name]:
+            if child not in blocked:
+                block_task(child)
+
+    def mark_done(name, code):
+        completed[name] = code
+        for child in dependents[name]:
+            if child in blocked:
+                continue
+            if code != 0:
+                block_task(child)
+                continue
+            pending_deps[child] -= 1
+            if pending_deps[child] == 0:
+                ready_queue.append(child)
 
     framework_root = Path(__file__).resolve().parents[1]
     run_error = None
+
+    # Wake the scheduler on SIGCHLD instead of polling at 1 Hz: child exits
+    # write a byte to this pipe, so the wait below returns immediately.
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_r, False)
+    os.set_blocking(wakeup_w, False)
+    old_wakeup_fd = signal.set_wakeup_fd(wakeup_w, warn_on_full_buffer=False)
+    old_sigchld = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    def wait_for_child(timeout):
+        ready, _, _ = select.select([wakeup_r], [], [], timeout)
+        if ready:
+            try:
+                while os.read(wakeup_r, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def prepare_launch(task):
+        worktree_value = format_template(
+            task["worktree"],
+            run_id=run_id,
+            phase=args.phase,
+            task=task["name"],
+        )
+        worktree = resolve_path(worktree_value, project_root)
+        branch = format_template(
+            task.get("branch", f"task/{task['name']}"),
+            run_id=run_id,
+            phase=args.phase,
+            task=task["name"],
+        )
+        prompt_path = resolve_path(task["prompt"], project_root)
+        if not prompt_path.exists():
+            raise RuntimeError(f"Prompt file not found: {prompt_path}")
+        command = build_command(runners, task, prompt_path)
+        interactive = bool(task.get("interactive"))
+        log_value = task.get("log")
+        if log_value:
+            log_value = format_template(
+                log_value,
+                run_id=run_id,
+                phase=args.phase,
+                task=task["name"],
+            )
+            log_path = resolve_path(log_value, project_root)
+        else:
+            log_path = logs_dir / f"{task['name']}.log"
+        pause_marker = None
+        if interactive:
+            pause_value = task.get("pause_marker", f"framework/logs/{task['name']}.pause")
+            pause_value = format_template(
+                pause_value,
+                run_id=run_id,
+                phase=args.phase,
+                task=task["name"],
+            )
+            pause_marker = resolve_path(pause_value, project_root)
+        argv = command_argv(command)
+        if argv:
+            cmd_name = argv[0]
+        else:
+            try:
+                parts = shlex.split(command)
+            except ValueError:
+                parts = []
+            cmd_name = parts[0] if parts else ""
+        return {
+            "task": task,
+            "worktree": worktree,
+            "branch": branch,
+            "prompt_path": prompt_path,
+            "command": command,
+            "argv": argv,
+            "cmd_name": cmd_name,
+            "interactive": interactive,
+            "log_path": log_path,
+            "pause_marker": pause_marker,
+        }
+
+    status_log_f = None
     try:
+        # Launch metadata is static per run; resolve it once up front so the
+        # scheduler ticks only dispatch.
+        launch_meta = {task["name"]: prepare_launch(task) for task in tasks}
+
         while len(completed) + len(blocked) < len(tasks):
-            progress = False
-            for task in tasks:
-                if task["name"] in running or task["name"] in completed:
-                    continue
-                if task["name"] in blocked:
-                    continue
-
-                failed_deps = [
-                    dep
-                    for dep in task["depends_on"]
-                    if dep in blocked or (dep in completed and completed[dep] != 0)
+            launch_names = [
+                name for name in ready_queue if name not in blocked
+            ]
+            ready_queue = []
+            progress = bool(launch_names)
+            launches = [launch_meta[name] for name in launch_names]
+            if launches and not args.dry_run:
+                # Worktree creation forks a git process per task; create them
+                # for the whole ready batch in parallel before launching.
+                to_create = [
+                    (spec["worktree"], spec["branch"]) for spec in launches
                 ]
-                if failed_deps:
-                    blocked[task["name"]] = failed_deps
-                    print(f"[BLOCKED] {task['name']} <- {', '.join(failed_deps)}")
-                    progress = True
-                    continue
-                if not can_start(task):
-                    continue
-
-                worktree_value = format_template(
-                    task["worktree"],
-                    run_id=run_id,
-                    phase=args.phase,
-                    task=task["name"],
-                )
-                worktree = resolve_path(worktree_value, project_root)
-                branch_value = format_template(
-                    task.get("branch", f"task/{task['name']}"),
-                    run_id=run_id,
-                    phase=args.phase,
-                    task=task["name"],
-                )
-                branch = branch_value
-                prompt_path = resolve_path(task["prompt"], project_root)
-                if not prompt_path.exists():
-                    raise RuntimeError(f"Prompt file not found: {prompt_path}")
-                command = build_command(runners, task, prompt_path)
-                interactive = bool(task.get("interactive"))
-                log_value = task.get("log")
-                if log_value:
-                    log_value = format_template(
-                        log_value,
-                        run_id=run_id,
-                        phase=args.phase,
-                        task=task["name"],
-                    )
-                    log_path = resolve_path(log_value, project_root)
+                if len(to_create) > 1:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=8) as ex:
+                        list(
+                            ex.map(
+                                lambda item: ensure_worktree(project_root, *item),
+                                to_create,
+                            )
+                        )
                 else:
-                    log_path = logs_dir / f"{task['name']}.log"
-                pause_marker = None
+                    for worktree, branch in to_create:
+                        ensure_worktree(project_root, worktree, branch)
+
+            for spec in launches:
+                task = spec["task"]
+                worktree = spec["worktree"]
+                branch = spec["branch"]
+                prompt_path = spec["prompt_path"]
+                command = spec["command"]
+                interactive = spec["interactive"]
+                log_path = spec["log_path"]
+                pause_marker = spec["pause_marker"]
                 resume_interactive = False
-                if interactive:
-                    pause_value = task.get("pause_marker", f"framework/logs/{task['name']}.pause")
-                    pause_value = format_template(
-                        pause_value,
-                        run_id=run_id,
-                        phase=args.phase,
-                        task=task["name"],
-                    )
-                    pause_marker = resolve_path(pause_value, project_root)
-                    if pause_marker.exists():
-                        resume_interactive = True
-                        pause_marker.unlink()
+                if pause_marker and pause_marker.exists():
+                    resume_interactive = True
+                    pause_marker.unlink()
 
                 write_event(
                     events_path,
@@ -587,17 +926,10 @@ def main():
                 )
 
                 if not args.dry_run:
-                    ensure_worktree(project_root, worktree, branch)
                     log_path.parent.mkdir(parents=True, exist_ok=True)
                     if interactive:
                         print(f"[START] {task['name']} (interactive) -> {log_path}")
-                        cmd_name = ""
-                        if isinstance(command, str):
-                            parts = shlex.split(command)
-                            if parts:
-                                cmd_name = parts[0]
-                        elif command:
-                            cmd_name = command[0]
+                        cmd_name = spec["cmd_name"]
                         interactive_pref = os.environ.get("FRAMEWORK_INTERACTIVE", "").strip().lower()
                         script_path = shutil.which("script")
                         use_attach = (
@@ -644,20 +976,33 @@ def main():
                             proc = subprocess.Popen(cmd, cwd=worktree)
                         running[task["name"]] = (proc, None, log_path, interactive, pause_marker)
                     else:
-                        log_f = open(log_path, "w", encoding="utf-8")
-                        print(f"[START] {task['name']} -> {log_path}")
-                        proc = subprocess.Popen(
-                            command,
-                            cwd=worktree,
-                            shell=True,
-                            stdout=log_f,
-                            stderr=subprocess.STDOUT,
+                        # Hand the raw fd to the child and close it here: the
+                        # child owns the log, so no Python file object needs
+                        # to stay open for the task's lifetime.
+                        log_fd = os.open(
+                            log_path,
+                            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC,
+                            0o644,
                         )
-                        running[task["name"]] = (proc, log_f, log_path, interactive, pause_marker)
+                        print(f"[START] {task['name']} -> {log_path}")
+                        # Shell-free commands exec directly (pre-parsed argv,
+                        # no /bin/sh fork); anything with shell syntax keeps
+                        # the shell.
+                        argv = spec["argv"]
+                        try:
+                            proc = subprocess.Popen(
+                                argv if argv is not None else command,
+                                cwd=worktree,
+                                shell=argv is None,
+                                stdout=log_fd,
+                                stderr=subprocess.STDOUT,
+                            )
+                        finally:
+                            os.close(log_fd)
+                        running[task["name"]] = (proc, None, log_path, interactive, pause_marker)
                 else:
                     print(f"[DRY-RUN] {task['name']} in {worktree} :: {command}")
-                    completed[task["name"]] = 0
-                progress = True
+                    mark_done(task["name"], 0)
                 last_progress_at = time.time()
 
             to_remove = []
@@ -674,9 +1019,9 @@ def main():
                         paused = True
                     if paused:
                         paused_tasks.add(name)
-                        completed[name] = 2
+                        mark_done(name, 2)
                     else:
-                        completed[name] = ret
+                        mark_done(name, ret)
                     exit_code = 2 if paused else ret
                     print(f"[DONE] {name} exit={exit_code}")
                     write_event(
@@ -714,18 +1059,34 @@ def main():
                 elapsed = format_duration(now - run_started_at)
                 line = f"[RUNNING] {names} (elapsed {elapsed})"
                 if any(item[3] for item in running.values()):
-                    status_log_path.parent.mkdir(parents=True, exist_ok=True)
-                    with status_log_path.open("a", encoding="utf-8") as f:
-                        f.write(f"{iso_ts(time.time())} {line}\n")
+                    if status_log_f is None or status_log_f.closed:
+                        status_log_path.parent.mkdir(parents=True, exist_ok=True)
+                        status_log_f = status_log_path.open("a", encoding="utf-8")
+                    status_log_f.write(f"{iso_ts(now)} {line}\n")
+                    status_log_f.flush()
                 else:
                     print(line)
                 last_progress_at = now
 
-            time.sleep(1)
+            flush_events()
+            if running:
+                timeout = None
+                if progress_interval:
+                    timeout = max(
+                        0.0, last_progress_at + progress_interval - time.time()
+                    )
+                wait_for_child(timeout)
     except Exception as exc:
         run_error = str(exc)
         print(f"[ERROR] {run_error}")
     finally:
+        signal.signal(signal.SIGCHLD, old_sigchld)
+        signal.set_wakeup_fd(old_wakeup_fd)
+        os.close(wakeup_r)
+        os.close(wakeup_w)
+        if status_log_f is not None and not status_log_f.closed:
+            status_log_f.close()
+        flush_events()
         if lock_created and lock_path.exists():
             lock_path.unlink()
 
@@ -735,34 +1096,39 @@ def main():
     summary_run = docs_dir / f"orchestrator-run-summary-{args.phase}-{run_id}.md"
     run_finished_at = time.time()
 
-    def write_summary(path: Path, include_pointer: bool = False) -> None:
-        with path.open("w", encoding="utf-8") as f:
-            f.write("# Orchestrator Run Summary\n\n")
-            f.write(f"- Run ID: {run_id}\n")
-            f.write(f"- Phase: {args.phase}\n")
-            f.write(f"- Started: {iso_ts(run_started_at)}\n")
-            f.write(f"- Finished: {iso_ts(run_finished_at)}\n")
-            f.write(f"- Framework version: {framework_version}\n")
-            if include_pointer:
-                f.write(f"- Summary file: {summary_run.name}\n")
-            f.write("\n")
-            if run_error:
-                f.write(f"- Error: {run_error}\n\n")
-            for task in tasks:
-                name = task["name"]
-                if name in completed:
-                    code = completed[name]
-                    if name in paused_tasks:
-                        status = "PAUSED"
-                    else:
-                        status = "OK" if code == 0 else f"FAIL ({code})"
-                else:
-                    deps = blocked.get(name, [])
-                    status = f"BLOCKED (deps: {', '.join(deps)})"
-                f.write(f"- {name}: {status}\n")
-
-    write_summary(summary_run, include_pointer=False)
-    write_summary(summary_latest, include_pointer=True)
+    # The two summary files differ only by the pointer line; build the body
+    # once and write each variant in a single call.
+    header = [
+        "# Orchestrator Run Summary",
+        "",
+        f"- Run ID: {run_id}",
+        f"- Phase: {args.phase}",
+        f"- Started: {iso_ts(run_started_at)}",
+        f"- Finished: {iso_ts(run_finished_at)}",
+        f"- Framework version: {framework_version}",
+    ]
+    body = [""]
+    if run_error:
+        body.append(f"- Error: {run_error}")
+        body.append("")
+    for task in tasks:
+        name = task["name"]
+        if name in completed:
+            code = completed[name]
+            if name in paused_tasks:
+                status = "PAUSED"
+            else:
+                status = "OK" if code == 0 else f"FAIL ({code})"
+        else:
+            deps = blocked.get(name, [])
+            status = f"BLOCKED (deps: {', '.join(deps)})"
+        body.append(f"- {name}: {status}")
+
+    summary_run.write_text("\n".join(header + body) + "\n", encoding="utf-8")
+    summary_latest.write_text(
+        "\n".join(header + [f"- Summary file: {summary_run.name}"] + body) + "\n",
+        encoding="utf-8",
+    )
 
     write_event(
         events_path,
@@ -772,9 +1138,13 @@ def main():
             "phase": args.phase,
             "timestamp": iso_ts(run_finished_at),
             "duration_sec": round(run_finished_at - run_started_at, 2),
-            "completed": completed,
-            "blocked": blocked,
-            "paused": sorted(paused_tasks),
+            # Per-task outcomes are already in the task_end/task_blocked
+            # stream; the run_end record only carries totals.
+            "tasks_total": len(tasks),
+            "completed": len(completed),
+            "failed": sum(1 for code in completed.values() if code not in (0, 2)),
+            "blocked": len(blocked),
+            "paused": len(paused_tasks),
             "error": run_error,
         },
     )
@@ -821,6 +1191,7 @@ def main():
                 "error": publish_error,
             },
         )
+    flush_events()
     exit_code = 0
     if failed_run:
         exit_code = 1
@@ -907,6 +1278,22 @@ def maybe_publish_report(cfg, phase, run_id, framework_root: Path, framework_ver
     if dry_run:
         cmd.append("--dry-run")
 
+    background = bool_from_env(
+        os.getenv("FRAMEWORK_REPORTING_BACKGROUND"),
+        reporting.get("background", False),
+    )
+    if background:
+        # Opt-in fire-and-forget: don't block main()'s exit path on
+        # interpreter startup plus network probing. Failures only show up
+        # in the detached process's own output.
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return None
+
     res = subprocess.run(cmd, check=False, text=True, capture_output=True)
     if res.returncode != 0:
         return res.stderr or res.stdout or "Report publish failed"
@@ -0,0 +1,19 @@
+"""Shared module loader for the test suite.
+
+Each test file used to re-implement ``load_module`` and re-exec the same
+source file; caching on (name, path) compiles and executes each module
+once per test process.
+"""
+
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
@@ -1,7 +1,6 @@
 import subprocess
 import sys
 import tempfile
-import time
 import unittest
 from pathlib import Path
 
@@ -114,15 +113,20 @@ class InteractiveDiscoveryTests(unittest.TestCase):
                     "--status-interval",
                     "0",
                 ],
-                stdout=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
+                text=True,
             )
-            time.sleep(0.5)
+            # Block on the watcher's startup line instead of sleeping a
+            # fixed half second.
+            ready = watcher.stdout.readline()
+            self.assertIn("protocol monitor started", ready)
             self.assertIsNone(watcher.poll())
             watcher.terminate()
             sleeper.terminate()
             watcher.wait(timeout=2)
             sleeper.wait(timeout=2)
+            watcher.stdout.close()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,8 @@
-import importlib.util
 import tempfile
 import unittest
 from pathlib import Path
 
-
-def load_module(name: str, path: Path):
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+from loader import load_module
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -1,14 +1,9 @@
-import importlib.util
+import tempfile
 import unittest
+import zipfile
 from pathlib import Path
 
-
-def load_module(name: str, path: Path):
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+from loader import load_module
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -35,6 +30,27 @@ class RedactionTests(unittest.TestCase):
         self.assertNotIn("sk_live_ABCdef1234567890", redacted)
         self.assertIn("***", redacted)
 
+    def test_copy_file_redacts_text_log_starting_with_pk(self):
+        # "PK" alone is not the zip magic; a log opening with "PKG ..."
+        # must still go through the redaction pass.
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "install.log"
+            src.write_text("PKG install started\napi_key=SECRET123\n", encoding="utf-8")
+            dest = Path(tmp) / "out" / "install.log"
+            export_report.copy_file(src, dest, redact=True)
+            copied = dest.read_text(encoding="utf-8")
+            self.assertNotIn("SECRET123", copied)
+            self.assertIn("PKG install started", copied)
+
+    def test_copy_file_copies_real_zip_verbatim(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "bundle.zip"
+            with zipfile.ZipFile(src, "w") as zf:
+                zf.writestr("inner.txt", "api_key=SECRET123\n")
+            dest = Path(tmp) / "out" / "bundle.zip"
+            export_report.copy_file(src, dest, redact=True)
+            self.assertEqual(dest.read_bytes(), src.read_bytes())
+
 
 if __name__ == "__main__":
     unittest.main()
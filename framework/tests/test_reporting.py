@@ -2,21 +2,13 @@ import os
 import unittest
 from pathlib import Path
 
+from loader import load_module
+
 
 ROOT = Path(__file__).resolve().parents[2]
 ORCH_PATH = ROOT / "framework" / "orchestrator" / "orchestrator.py"
 
 
-def load_module(name: str, path: Path):
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
-
-
 orchestrator = load_module("orchestrator_reporting", ORCH_PATH)
 
 
@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 import argparse
 import json
-import re
+import os
+
+try:
+    # The third-party regex engine degrades more gracefully than stdlib
+    # re on adversarial log lines (long unmatched quoted suffixes).
+    import regex as re
+except ImportError:
+    import re
+
 import shutil
 import tempfile
-import time
+from datetime import datetime
 from pathlib import Path
 import zipfile
 
@@ -20,47 +28,77 @@ ORCH_DIR = ROOT / "orchestrator"
 OUTBOX_DIR = ROOT / "outbox"
 REPORTING_DIR = DOCS_DIR / "reporting"
 
-SENSITIVE_PATTERNS = [
-    # key=value or key: value (env/logs)
-    (re.compile(r"(?i)\b(api[-_ ]?key|token|secret|password|passwd|pwd|access[-_ ]?key|client[-_ ]?secret|private[-_ ]?key)\b\s*[:=]\s*([^\s\"'`]+)"), "kv"),
-    # JSON style "key": "value"
-    (re.compile(r"(?i)\"(api[-_ ]?key|token|secret|password|passwd|pwd|access[-_ ]?key|client[-_ ]?secret|private[-_ ]?key)\"\s*:\s*\"([^\"]+)\""), "json"),
-    # Authorization/Bearer
-    (re.compile(r"(?i)authorization\s*[:=]\s*(bearer\s+)?([^\s\"'`]+)"), "auth"),
-    # AWS keys
-    (re.compile(r"AKIA[0-9A-Z]{16}"), "fixed"),
-    (re.compile(r"(?i)(aws_secret_access_key)\s*[:=]\s*([^\s\"'`]+)"), "kv"),
-    # JWT-like tokens
-    (re.compile(r"eyJ[\w-]{10,}\.[\w-]{10,}\.[\w-]{10,}"), "fixed"),
-    # GitHub/Stripe/Supabase common tokens
-    (re.compile(r"ghp_[0-9A-Za-z]{30,}"), "fixed"),
-    (re.compile(r"github_pat_[0-9A-Za-z_]{20,}"), "fixed"),
-    (re.compile(r"sk_live_[0-9a-zA-Z]{10,}"), "fixed"),
-    (re.compile(r"sk_test_[0-9a-zA-Z]{10,}"), "fixed"),
-    (re.compile(r"whsec_[0-9a-zA-Z]{10,}"), "fixed"),
-]
-
-
-def _redact_match(mode: str, match: re.Match) -> str:
-    if mode == "kv":
-        return f"{match.group(1)}: ***"
-    if mode == "json":
-        return f"\"{match.group(1)}\": \"***\""
-    if mode == "auth":
-        prefix = match.group(1) or ""
+# File types that deflate poorly (already compressed).
+STORED_SUFFIXES = {".zip", ".gz", ".tgz", ".zst", ".png", ".jpg", ".jpeg", ".webp"}
+
+_SECRET_KEYS = (
+    r"api[-_ ]?key|token|secret|password|passwd|pwd|"
+    r"access[-_ ]?key|client[-_ ]?secret|private[-_ ]?key"
+)
+
+# All secret shapes combined into one alternation so a redaction pass is a
+# single scan of the text instead of one scan per pattern; the replacement
+# is picked by which named group matched.
+SENSITIVE_RE = re.compile(
+    "|".join(
+        [
+            # key=value or key: value (env/logs)
+            rf"(?i:\b(?P<kv_key>{_SECRET_KEYS}|aws_secret_access_key)\b\s*[:=]\s*[^\s\"'`]+)",
+            # JSON style "key": "value"
+            rf"(?i:\"(?P<json_key>{_SECRET_KEYS})\"\s*:\s*\"[^\"]+\")",
+            # Authorization/Bearer
+            r"(?i:(?P<auth>authorization)\s*[:=]\s*(?P<auth_bearer>bearer\s+)?[^\s\"'`]+)",
+            # AWS keys
+            r"AKIA[0-9A-Z]{16}",
+            # JWT-like tokens
+            r"eyJ[\w-]{10,}\.[\w-]{10,}\.[\w-]{10,}",
+            # GitHub/Stripe/Supabase common tokens
+            r"ghp_[0-9A-Za-z]{30,}",
+            r"github_pat_[0-9A-Za-z_]{20,}",
+            r"sk_live_[0-9a-zA-Z]{10,}",
+            r"sk_test_[0-9a-zA-Z]{10,}",
+            r"whsec_[0-9a-zA-Z]{10,}",
+        ]
+    )
+)
+
+
+def _redact_match(match: re.Match) -> str:
+    key = match.group("kv_key")
+    if key is not None:
+        return f"{key}: ***"
+    key = match.group("json_key")
+    if key is not None:
+        return f"\"{key}\": \"***\""
+    if match.group("auth") is not None:
+        prefix = match.group("auth_bearer") or ""
         return f"authorization: {prefix}***".strip()
     return "***"
 
 
 def redact_text(text: str) -> str:
-    for pattern, mode in SENSITIVE_PATTERNS:
-        text = pattern.sub(lambda m: _redact_match(mode, m), text)
+    text = SENSITIVE_RE.sub(_redact_match, text)
     if "PRIVATE KEY" in text:
-        text = re.sub(
-            r"-----BEGIN[^-]+-----[\s\S]*?-----END[^-]+-----",
-            "<REDACTED PRIVATE KEY>",
-            text,
-        )
+        # The PEM delimiters are literal, so slice on str.find instead of
+        # an unanchored [\s\S]*? regex over the whole text.
+        out = []
+        i = 0
+        while (begin := text.find("-----BEGIN", i)) != -1:
+            hdr_end = text.find("-----", begin + 10)
+            if hdr_end == -1:
+                break
+            end = text.find("-----END", hdr_end)
+            if end == -1:
+                break
+            tail = text.find("-----", end + 8)
+            if tail == -1:
+                break
+            out.append(text[i:begin])
+            out.append("<REDACTED PRIVATE KEY>")
+            i = tail + 5
+        if out:
+            out.append(text[i:])
+            text = "".join(out)
     return text
 
 
@@ -73,16 +111,31 @@ def parse_run_id() -> str:
                 return line.split(":", 1)[1].strip()
     jsonl = LOGS_DIR / "framework-run.jsonl"
     if jsonl.exists():
-        run_id = None
-        for line in jsonl.read_text(encoding="utf-8", errors="ignore").splitlines():
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if payload.get("event") == "run_end":
-                run_id = payload.get("run_id") or run_id
-        if run_id:
-            return run_id
+        # Only the last run_end matters, so read the file backwards in
+        # blocks and stop at the first one found instead of parsing the
+        # whole (potentially multi-MB) event log.
+        with jsonl.open("rb") as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            tail = b""
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step) + tail
+                lines = block.split(b"\n")
+                # The first piece may be a partial line; carry it into the
+                # next (earlier) block unless we are at the start of file.
+                tail = lines.pop(0) if pos > 0 else b""
+                for line in reversed(lines):
+                    if b"run_end" not in line:
+                        continue
+                    try:
+                        payload = json.loads(line.decode("utf-8", errors="ignore"))
+                    except json.JSONDecodeError:
+                        continue
+                    if payload.get("event") == "run_end" and payload.get("run_id"):
+                        return payload["run_id"]
     return "unknown"
 
 
@@ -97,22 +150,62 @@ def is_under(path: Path, base: Path) -> bool:
 def copy_file(src: Path, dest: Path, redact: bool) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     if redact:
-        text = src.read_text(encoding="utf-8", errors="ignore")
-        dest.write_text(redact_text(text), encoding="utf-8")
+        # Binary or already-compressed payloads gain nothing from a text
+        # redaction pass; sniff the head and copy those verbatim. Zip
+        # needs the full 4-byte magics — a text log can open with "PK".
+        with src.open("rb") as f:
+            head = f.read(4096)
+        if (
+            b"\x00" in head
+            or head[:2] == b"\x1f\x8b"
+            or head[:4] in (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
+        ):
+            shutil.copy2(src, dest)
+            return
+        # Stream line by line so multi-MB logs are never held in memory
+        # and each regex pass runs on bounded input. PEM blocks span
+        # lines, so they are tracked with a small state flag.
+        in_pem = False
+        with src.open("r", encoding="utf-8", errors="ignore") as fin, \
+                dest.open("w", encoding="utf-8") as fout:
+            for line in fin:
+                if in_pem:
+                    if "-----END" in line:
+                        in_pem = False
+                    continue
+                stripped = line.lstrip()
+                if stripped.startswith("-----BEGIN") and "PRIVATE KEY" in stripped:
+                    fout.write("<REDACTED PRIVATE KEY>\n")
+                    in_pem = "-----END" not in stripped[10:]
+                    continue
+                fout.write(redact_text(line))
     else:
         shutil.copy2(src, dest)
 
 
-def add_tree(src_dir: Path, dest_dir: Path, redact: bool, collected: list) -> None:
+def add_tree(src_dir: Path, dest_dir: Path, redact: bool, collected: list, root: Path) -> None:
     if not src_dir.exists():
         return
-    for path in src_dir.rglob("*"):
-        if path.is_dir():
-            continue
-        rel = path.relative_to(src_dir)
-        dest = dest_dir / rel
-        copy_file(path, dest, redact=redact)
-        collected.append(str(dest))
+    # os.walk rides on scandir, so file-vs-dir comes from the directory
+    # entries instead of a stat per path as rglob does.
+    pairs = []
+    for dirpath, _dirnames, filenames in os.walk(src_dir):
+        base = Path(dirpath)
+        for name in filenames:
+            path = base / name
+            pairs.append((path, dest_dir / path.relative_to(src_dir)))
+    if not pairs:
+        return
+    if len(pairs) == 1:
+        copy_file(pairs[0][0], pairs[0][1], redact=redact)
+    else:
+        # Copies (and redaction passes) are I/O-bound with distinct
+        # destinations, so overlap them across a small thread pool.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as ex:
+            list(ex.map(lambda pair: copy_file(pair[0], pair[1], redact=redact), pairs))
+    collected.extend(dest.relative_to(root).as_posix() for _, dest in pairs)
 
 
 def main() -> None:
@@ -123,6 +216,12 @@ def main() -> None:
     parser.add_argument("--include-migration", action="store_true", help="Include framework/migration")
     parser.add_argument("--include-task-logs", action="store_true", help="Include framework/logs/*.log")
     parser.add_argument("--no-redact", action="store_true", help="Disable log redaction")
+    parser.add_argument(
+        "--compression",
+        choices=["deflated", "stored"],
+        default="deflated",
+        help="Zip compression for the bundle (stored skips deflate entirely)",
+    )
     args = parser.parse_args()
 
     run_id = args.run_id or parse_run_id()
@@ -138,54 +237,69 @@ def main() -> None:
 
         if SUMMARY_PATH.exists():
             copy_file(SUMMARY_PATH, tmp_root / "docs/orchestrator-run-summary.md", redact=False)
-            collected.append(str(tmp_root / "docs/orchestrator-run-summary.md"))
+            collected.append("docs/orchestrator-run-summary.md")
         if DOCS_DIR.exists():
             for path in DOCS_DIR.glob("orchestrator-run-summary-*.md"):
                 copy_file(path, tmp_root / f"docs/{path.name}", redact=False)
-                collected.append(str(tmp_root / f"docs/{path.name}"))
+                collected.append(f"docs/{path.name}")
 
         if VERSION_PATH.exists():
             copy_file(VERSION_PATH, tmp_root / "VERSION", redact=False)
-            collected.append(str(tmp_root / "VERSION"))
+            collected.append("VERSION")
 
         jsonl = LOGS_DIR / "framework-run.jsonl"
         if jsonl.exists():
             copy_file(jsonl, tmp_root / "logs/framework-run.jsonl", redact=redact_logs)
-            collected.append(str(tmp_root / "logs/framework-run.jsonl"))
+            collected.append("logs/framework-run.jsonl")
 
         if args.include_task_logs and LOGS_DIR.exists():
             for path in LOGS_DIR.glob("*.log"):
                 copy_file(path, tmp_root / f"logs/{path.name}", redact=redact_logs)
-                collected.append(str(tmp_root / f"logs/{path.name}"))
+                collected.append(f"logs/{path.name}")
 
-        add_tree(FRAMEWORK_REVIEW_DIR, tmp_root / "framework-review", redact=False, collected=collected)
+        add_tree(FRAMEWORK_REVIEW_DIR, tmp_root / "framework-review", redact=False, collected=collected, root=tmp_root)
 
         if args.include_review:
-            add_tree(REVIEW_DIR, tmp_root / "review", redact=False, collected=collected)
+            add_tree(REVIEW_DIR, tmp_root / "review", redact=False, collected=collected, root=tmp_root)
 
         if args.include_migration:
-            add_tree(MIGRATION_DIR, tmp_root / "migration", redact=False, collected=collected)
+            add_tree(MIGRATION_DIR, tmp_root / "migration", redact=False, collected=collected, root=tmp_root)
 
         if ORCH_DIR.exists():
-            add_tree(ORCH_DIR, tmp_root / "orchestrator", redact=False, collected=collected)
+            add_tree(ORCH_DIR, tmp_root / "orchestrator", redact=False, collected=collected, root=tmp_root)
         if REPORTING_DIR.exists():
-            add_tree(REPORTING_DIR, tmp_root / "docs/reporting", redact=False, collected=collected)
+            add_tree(REPORTING_DIR, tmp_root / "docs/reporting", redact=False, collected=collected, root=tmp_root)
 
         manifest = {
             "run_id": run_id,
-            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
             "redaction": "on" if redact_logs else "off",
-            "included": sorted({str(Path(p).relative_to(tmp_root)) for p in collected}),
+            "included": sorted(set(collected)),
         }
-        manifest_path = tmp_root / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest, ensure_ascii=True, indent=2), encoding="utf-8")
 
+        compression = (
+            zipfile.ZIP_DEFLATED if args.compression == "deflated" else zipfile.ZIP_STORED
+        )
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(out_path, "w", compression=compression) as zf:
             for path in tmp_root.rglob("*"):
                 if path.is_dir():
                     continue
-                zf.write(path, path.relative_to(tmp_root).as_posix())
+                # Deflating already-compressed payloads wastes CPU for no
+                # size win; store those as-is.
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if path.suffix.lower() in STORED_SUFFIXES
+                    else compression
+                )
+                zf.write(
+                    path,
+                    path.relative_to(tmp_root).as_posix(),
+                    compress_type=compress_type,
+                )
+            # The manifest never needs to exist on disk; write it into
+            # the archive directly.
+            zf.writestr("manifest.json", json.dumps(manifest, ensure_ascii=True, indent=2))
 
     print(f"Report bundle created: {out_path}")
 
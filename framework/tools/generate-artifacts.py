@@ -4,13 +4,17 @@ import re
 from pathlib import Path
 
 
+Q_RE = re.compile(r"^-\s*Q(\d+):")
+A_RE = re.compile(r"^\s*-\s*A(\d+):")
+
+
 def parse_interview(path: Path) -> dict:
     answers = {}
     current_q = None
+    # Entries are stripped as they are appended, so the join needs no
+    # second strip pass over the accumulated lines.
     current_a = []
     in_answer = False
-    q_re = re.compile(r"^-\s*Q(\d+):")
-    a_re = re.compile(r"^\s*-\s*A(\d+):")
 
     for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
         line = raw.rstrip()
@@ -18,26 +22,30 @@ def parse_interview(path: Path) -> dict:
             if in_answer and current_q:
                 current_a.append("")
             continue
-        q_match = q_re.match(line)
-        if q_match:
-            if current_q and current_a:
-                answers[current_q] = " ".join([s.strip() for s in current_a if s is not None]).strip()
-            current_q = q_match.group(1)
-            current_a = []
-            in_answer = False
-            continue
-        a_match = a_re.match(line)
-        if a_match:
-            current_q = a_match.group(1)
-            answer = line.split(":", 1)[1].strip() if ":" in line else ""
-            current_a = [answer]
-            in_answer = True
-            continue
+        # Q/A markers always start with a dash; gate the regexes on that
+        # so plain answer-body lines (the common case) skip them.
+        if line.startswith("-"):
+            q_match = Q_RE.match(line)
+            if q_match:
+                if current_q and current_a:
+                    answers[current_q] = " ".join(current_a).strip()
+                current_q = q_match.group(1)
+                current_a = []
+                in_answer = False
+                continue
+        if line.lstrip().startswith("-"):
+            a_match = A_RE.match(line)
+            if a_match:
+                current_q = a_match.group(1)
+                answer = line.split(":", 1)[1].strip() if ":" in line else ""
+                current_a = [answer]
+                in_answer = True
+                continue
         if in_answer and current_q:
             current_a.append(line.strip())
 
     if current_q and current_a:
-        answers[current_q] = " ".join([s.strip() for s in current_a if s is not None]).strip()
+        answers[current_q] = " ".join(current_a).strip()
     return answers
 
 
@@ -46,7 +54,7 @@ def get_answer(answers: dict, qnum: str, fallback: str) -> str:
 
 
 def missing_questions(answers: dict, required: list) -> list:
-    return [q for q in required if q not in answers or not answers[q].strip()]
+    return [q for q in required if not answers.get(q, "").strip()]
 
 
 def write_file(path: Path, content: str, overwrite: bool) -> None:
@@ -2,18 +2,21 @@
 import argparse
 import fcntl
 import os
-import select
+import selectors
 import shlex
 import signal
 import subprocess
 import sys
 import termios
 import time
+from datetime import datetime
 from pathlib import Path
 
 
 def iso_ts() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+    # Same format as time.strftime("%Y-%m-%dT%H:%M:%S") but skips the
+    # per-call tm struct and format parsing.
+    return datetime.now().isoformat(timespec="seconds")
 
 
 def run_interactive(
@@ -35,16 +38,17 @@ def run_interactive(
         cmd = command
 
     stdin_state = None
-    prompt_payload = None
+    prompt_stream = None
     if prompt_file:
-        try:
-            prompt_payload = prompt_file.read_text(encoding="utf-8")
-        except Exception:
-            prompt_payload = None
-
-    if prompt_mode == "arg" and prompt_payload is not None:
-        cmd = cmd + [prompt_payload.rstrip()]
-        prompt_payload = None
+        if prompt_mode == "arg":
+            # argv entries must be materialized; only this mode reads the
+            # whole prompt into memory.
+            try:
+                cmd = cmd + [prompt_file.read_text(encoding="utf-8").rstrip()]
+            except Exception:
+                pass
+        else:
+            prompt_stream = prompt_file
 
     def setup_child() -> None:
         os.setsid()
@@ -66,7 +70,7 @@ def run_interactive(
     stdin_fd = sys.stdin.fileno()
     stdin_is_tty = sys.stdin.isatty()
     stdout_fd = sys.stdout.fileno()
-    buffer = b""
+    buffer = bytearray()
     pause_requested = False
     pause_deadline = None
 
@@ -82,10 +86,28 @@ def run_interactive(
             stdin_state = None
 
     def send_prompt() -> None:
-        if not prompt_payload:
+        if prompt_stream is None:
             return
-        payload = prompt_payload.rstrip() + "\n"
-        os.write(master_fd, payload.encode("utf-8"))
+        # Stream the prompt to the pty in chunks, holding back trailing
+        # whitespace so the payload ends with exactly one newline.
+        wrote = False
+        try:
+            with prompt_stream.open("rb") as f:
+                carry = b""
+                while True:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    data = carry + chunk
+                    stripped = data.rstrip()
+                    if stripped:
+                        os.write(master_fd, stripped)
+                        wrote = True
+                    carry = data[len(stripped):]
+        except OSError:
+            return
+        if wrote:
+            os.write(master_fd, b"\n")
 
     # Send initial prompt once to seed the interactive session.
     send_prompt()
@@ -98,30 +120,78 @@ def run_interactive(
             f"paused_at: {iso_ts()}\ncommand: {pause_cmd}\n", encoding="utf-8"
         )
 
+    # Block on readiness instead of waking every 250 ms. Pty EOF/EIO is
+    # not a reliable exit signal (a grandchild can keep the slave open),
+    # so the child's pidfd is watched too: its readability wakes the loop
+    # the moment the child exits. Without pidfd support the select is
+    # capped at 1 s so proc.poll() still notices the exit.
+    sel = selectors.DefaultSelector()
+    sel.register(master_fd, selectors.EVENT_READ)
+    if stdin_is_tty:
+        sel.register(stdin_fd, selectors.EVENT_READ)
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    else:
+        sel.register(pidfd, selectors.EVENT_READ)
+
+    # Transcript writes ride the file object's buffer; flush at most once
+    # a second (the stall watcher checks mtime on that cadence) instead of
+    # paying a write syscall per pty packet.
+    last_flush = time.monotonic()
+
+    def maybe_flush() -> None:
+        nonlocal last_flush
+        now = time.monotonic()
+        if now - last_flush >= 1.0:
+            log_f.flush()
+            last_flush = now
+
     try:
         while True:
             if proc.poll() is not None:
+                # Drain whatever the child flushed before exiting.
+                while True:
+                    try:
+                        data = os.read(master_fd, 65536)
+                    except OSError:
+                        break
+                    if not data:
+                        break
+                    os.write(stdout_fd, data)
+                    log_f.write(data)
+                log_f.flush()
                 break
-            read_fds = [master_fd]
-            if stdin_is_tty:
-                read_fds.append(stdin_fd)
-            ready, _, _ = select.select(read_fds, [], [], 0.25)
+            timeout = None if pidfd is not None else 1.0
+            if pause_deadline is not None:
+                remaining = max(0.0, pause_deadline - time.time())
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            ready = {key.fd for key, _ in sel.select(timeout)}
             if master_fd in ready:
-                data = os.read(master_fd, 4096)
+                try:
+                    data = os.read(master_fd, 65536)
+                except OSError:
+                    # EIO: child side of the pty is gone.
+                    break
                 if not data:
                     break
                 os.write(stdout_fd, data)
                 log_f.write(data)
-                log_f.flush()
+                maybe_flush()
             if stdin_is_tty and stdin_fd in ready:
                 data = os.read(stdin_fd, 4096)
                 if not data:
                     break
                 # Forward user input immediately to child.
                 os.write(master_fd, data)
+                # Scan for complete lines in place; splitting the buffer
+                # per line would copy the tail once per line on pastes.
                 buffer += data
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
+                start = 0
+                while (nl := buffer.find(b"\n", start)) != -1:
+                    line = bytes(buffer[start:nl])
+                    start = nl + 1
                     try:
                         decoded = line.decode("utf-8", errors="ignore").strip()
                     except Exception:
@@ -137,6 +207,12 @@ def run_interactive(
                         log_f.write(message.encode("utf-8"))
                         log_f.flush()
                         write_pause_marker()
+                if start:
+                    del buffer[:start]
+                # The pause command is short; an unbounded line (a paste
+                # with no newline) only needs its tail kept around.
+                if len(buffer) > 4096:
+                    del buffer[:-4096]
             if pause_requested and pause_deadline and time.time() >= pause_deadline:
                 try:
                     proc.send_signal(signal.SIGTERM)
@@ -150,6 +226,12 @@ def run_interactive(
                         pass
                 return 2
     finally:
+        sel.close()
+        if pidfd is not None:
+            try:
+                os.close(pidfd)
+            except OSError:
+                pass
         if stdin_state is not None:
             try:
                 termios.tcsetattr(stdin_fd, termios.TCSADRAIN, stdin_state)
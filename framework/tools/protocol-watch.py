@@ -2,14 +2,35 @@
 import argparse
 import json
 import os
+import select
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both decoders raise a ValueError subclass on bad input.
+_loads = orjson.loads if orjson is not None else json.loads
 import signal
 import sys
 import time
 from pathlib import Path
 
 
+_iso_ts_last = (None, "")
+
+
 def iso_ts() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+    # Timestamps have whole-second resolution; cache the last formatted
+    # second so status/alert bursts skip the strftime/localtime pair.
+    global _iso_ts_last
+    second = int(time.time())
+    if second != _iso_ts_last[0]:
+        _iso_ts_last = (
+            second,
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)),
+        )
+    return _iso_ts_last[1]
 
 
 def format_duration(seconds: float) -> str:
@@ -21,10 +42,23 @@ def format_duration(seconds: float) -> str:
     return f"{minutes:02d}:{sec:02d}"
 
 
+# Open append handles once per path; re-opening (and re-mkdir'ing the
+# parent) per message wastes syscalls under event bursts.
+_APPEND_LOGS: dict = {}
+
+
+def _append_line(log_path: Path, message: str) -> None:
+    f = _APPEND_LOGS.get(log_path)
+    if f is None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        f = log_path.open("a", encoding="utf-8")
+        _APPEND_LOGS[log_path] = f
+    f.write(f"{iso_ts()} {message}\n")
+    f.flush()
+
+
 def write_alert(log_path: Path, message: str) -> None:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(f"{iso_ts()} {message}\n")
+    _append_line(log_path, message)
 
 
 def pid_alive(pid: int) -> bool:
@@ -53,22 +87,11 @@ def main() -> None:
     alerts_path = logs_dir / "protocol-alerts.log"
     status_path = logs_dir / "protocol-status.log"
 
-    last_pos = 0
+    state_path = logs_dir / "protocol-watch.state.json"
+    events_ino = None
     if events_path.exists():
-        last_run_start = 0
-        with events_path.open("rb") as f:
-            while True:
-                pos = f.tell()
-                line = f.readline()
-                if not line:
-                    break
-                try:
-                    payload = json.loads(line.decode("utf-8", errors="ignore").strip())
-                except json.JSONDecodeError:
-                    continue
-                if payload.get("event") == "run_start":
-                    last_run_start = pos
-        last_pos = last_run_start
+        events_ino = events_path.stat().st_ino
+
     active_task = None
     active_log = None
     last_log_mtime = None
@@ -78,79 +101,199 @@ def main() -> None:
     run_started_at = None
     tasks_total = None
     status = {}
+    # Incremental counters for the status line, maintained on
+    # task_start/task_end so emitting it stays O(1) in task count.
+    running_set = set()
+    done_count = 0
     active_interactive = False
+
+    # A restarted watcher resumes from the checkpointed offset instead of
+    # re-reading every event since the run began; the inode check guards
+    # against a rotated/recreated log.
+    last_pos = 0
+    if state_path.exists() and events_ino is not None:
+        try:
+            saved = _loads(state_path.read_bytes())
+        except ValueError:
+            saved = None
+        if (
+            saved
+            and saved.get("ino") == events_ino
+            and saved.get("offset", 0) <= events_path.stat().st_size
+        ):
+            last_pos = saved["offset"]
+            run_id = saved.get("run_id")
+            phase = saved.get("phase")
+            tasks_total = saved.get("tasks_total")
+            active_task = saved.get("active_task")
+            active_log = saved.get("active_log")
+            active_interactive = bool(saved.get("active_interactive"))
+            status = saved.get("status") or {}
+            running_set = {k for k, v in status.items() if v == "RUNNING"}
+            done_count = sum(
+                1 for v in status.values() if v.startswith("OK") or v.startswith("FAIL")
+            )
+            if phase:
+                run_started_at = time.time()
+    # Never trust the offset blindly: a checkpoint always trails the
+    # previous run's run_end (the watcher exits on that event before it
+    # saves), so a watcher spawned for the next phase would otherwise
+    # replay the old run's tail and quit at its run_end. Scan forward
+    # from the resume point — O(new events) with a checkpoint, the whole
+    # file without one — and start clean at the newest run_start found.
+    if events_path.exists():
+        newer_start = None
+        with events_path.open("rb") as f:
+            f.seek(last_pos)
+            while True:
+                pos = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    payload = _loads(line.strip())
+                except ValueError:
+                    continue
+                if payload.get("event") == "run_start":
+                    newer_start = pos
+        if newer_start is not None:
+            last_pos = newer_start
+            run_id = None
+            phase = None
+            run_started_at = None
+            tasks_total = None
+            active_task = None
+            active_log = None
+            last_log_mtime = None
+            active_interactive = False
+            status = {}
+            running_set = set()
+            done_count = 0
+    events_f = None
+
+    def save_state() -> None:
+        payload = {
+            "ino": events_ino,
+            "offset": last_pos,
+            "run_id": run_id,
+            "phase": phase,
+            "tasks_total": tasks_total,
+            "active_task": active_task,
+            "active_log": active_log,
+            "active_interactive": active_interactive,
+            "status": status,
+        }
+        tmp = state_path.with_name(state_path.name + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(state_path)
+
     status_interval = args.status_interval
     if status_interval <= 0:
         status_interval = None
     next_status_at = time.time() + status_interval if status_interval else None
 
-    print("[WATCH] protocol monitor started")
+    # Sleep on the orchestrator's pidfd where the platform has one: the
+    # wait doubles as exit detection, so the watcher wakes the moment the
+    # orchestrator dies instead of up to a full poll interval later.
+    try:
+        pidfd = os.pidfd_open(args.pid)
+    except (AttributeError, OSError):
+        pidfd = None
+
+    # Flush so a parent reading our pipe sees the ready line immediately.
+    print("[WATCH] protocol monitor started", flush=True)
 
     while True:
+        # One wall-clock read per tick; every check below reuses it
+        # instead of issuing its own clock_gettime syscall.
+        now = time.time()
         if not pid_alive(args.pid):
             print("[WATCH] orchestrator exited")
             return
 
-        if events_path.exists():
-            with events_path.open("r", encoding="utf-8", errors="ignore") as f:
-                f.seek(last_pos)
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        payload = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    event = payload.get("event")
-                    if event == "run_start":
-                        run_id = payload.get("run_id")
-                        phase = payload.get("phase")
-                        run_started_at = time.time()
-                        tasks_total = payload.get("tasks_total")
-                        status = {}
-                    elif event == "task_start":
-                        active_task = payload.get("task")
-                        active_log = payload.get("log")
-                        active_interactive = bool(payload.get("interactive"))
+        if events_f is None and events_path.exists():
+            # One handle for the life of the run instead of an
+            # open+seek+close per tick.
+            events_f = events_path.open("rb")
+            if events_ino is None:
+                events_ino = os.fstat(events_f.fileno()).st_ino
+            events_f.seek(last_pos)
+        if events_f is not None:
+            consumed = 0
+            while True:
+                pos = events_f.tell()
+                raw = events_f.readline()
+                if not raw:
+                    break
+                if not raw.endswith(b"\n"):
+                    # Partial line still being written; retry next tick.
+                    events_f.seek(pos)
+                    break
+                line = raw.strip()
+                if not line:
+                    continue
+                consumed += 1
+                try:
+                    payload = _loads(line)
+                except ValueError:
+                    continue
+                event = payload.get("event")
+                if event == "run_start":
+                    run_id = payload.get("run_id")
+                    phase = payload.get("phase")
+                    run_started_at = now
+                    tasks_total = payload.get("tasks_total")
+                    status = {}
+                    running_set = set()
+                    done_count = 0
+                elif event == "task_start":
+                    active_task = payload.get("task")
+                    active_log = payload.get("log")
+                    active_interactive = bool(payload.get("interactive"))
+                    last_log_mtime = None
+                    if active_task:
+                        status[active_task] = "RUNNING"
+                        running_set.add(active_task)
+                    print(f"[TASK] start {active_task}")
+                elif event == "task_end":
+                    name = payload.get("task")
+                    code = payload.get("exit_code")
+                    print(f"[TASK] done {name} exit={code}")
+                    if name:
+                        running_set.discard(name)
+                        if payload.get("paused") or code == 2:
+                            status[name] = "PAUSED"
+                        else:
+                            status[name] = "OK" if code == 0 else f"FAIL({code})"
+                            done_count += 1
+                    if name == active_task:
+                        active_task = None
+                        active_log = None
                         last_log_mtime = None
-                        if active_task:
-                            status[active_task] = "RUNNING"
-                        print(f"[TASK] start {active_task}")
-                    elif event == "task_end":
-                        name = payload.get("task")
-                        code = payload.get("exit_code")
-                        print(f"[TASK] done {name} exit={code}")
-                        if name:
-                            if payload.get("paused") or code == 2:
-                                status[name] = "PAUSED"
-                            else:
-                                status[name] = "OK" if code == 0 else f"FAIL({code})"
-                        if name == active_task:
-                            active_task = None
-                            active_log = None
-                            last_log_mtime = None
-                            active_interactive = False
-                    elif event == "run_end":
-                        print("[WATCH] run_end")
-                        return
-                last_pos = f.tell()
+                        active_interactive = False
+                elif event == "run_end":
+                    print("[WATCH] run_end")
+                    # The run is over; a leftover checkpoint would only
+                    # tempt the next phase's watcher into old events.
+                    try:
+                        state_path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    return
+            last_pos = events_f.tell()
+            if consumed:
+                save_state()
 
         # stall detection
-        now = time.time()
         if status_interval and now >= next_status_at and phase:
-            running = [k for k, v in status.items() if v == "RUNNING"]
-            done = [k for k, v in status.items() if v.startswith("OK") or v.startswith("FAIL")]
             total = tasks_total if tasks_total is not None else len(status)
             elapsed = format_duration(now - run_started_at) if run_started_at else "00:00"
-            running_str = ",".join(running) if running else "-"
+            running_str = ",".join(sorted(running_set)) if running_set else "-"
             line = (
                 f"[STATUS] phase={phase} run_id={run_id} "
-                f"running={running_str} done={len(done)}/{total} elapsed={elapsed}"
+                f"running={running_str} done={done_count}/{total} elapsed={elapsed}"
             )
-            status_path.parent.mkdir(parents=True, exist_ok=True)
-            with status_path.open("a", encoding="utf-8") as f:
-                f.write(f"{iso_ts()} {line}\n")
+            _append_line(status_path, line)
             if not (active_interactive and phase == "discovery"):
                 print(line)
             next_status_at = now + status_interval
@@ -187,7 +330,10 @@ def main() -> None:
                         last_log_mtime = mtime
             last_log_check = now
 
-        time.sleep(args.poll_interval)
+        if pidfd is not None:
+            select.select([pidfd], [], [], args.poll_interval)
+        else:
+            time.sleep(args.poll_interval)
 
 
 if __name__ == "__main__":
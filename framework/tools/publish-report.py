@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 import argparse
+import base64
 import json
 import os
-import shutil
 import subprocess
-import tempfile
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -40,25 +41,24 @@ def ensure_zip(
     return default_zip
 
 
-def github_request(token: str, method: str, url: str, payload: dict):
-    data = json.dumps(payload).encode("utf-8")
-    cmd = [
-        "curl",
-        "-sS",
-        "-X",
-        method,
-        "-H",
-        f"Authorization: token {token}",
-        "-H",
-        "Content-Type: application/json",
+def github_request(token: str, method: str, url: str, payload: dict | None = None):
+    req = urllib.request.Request(
         url,
-        "-d",
-        data.decode("utf-8"),
-    ]
-    res = run(cmd)
-    if res.returncode != 0:
-        raise RuntimeError(res.stderr or res.stdout)
-    return res.stdout
+        data=None if payload is None else json.dumps(payload).encode("utf-8"),
+        method=method,
+        headers={
+            "Authorization": f"token {token}",
+            "Content-Type": "application/json",
+        },
+    )
+    try:
+        with urllib.request.urlopen(req) as res:
+            return res.read().decode("utf-8")
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="ignore")
+        raise RuntimeError(detail or str(exc))
+    except urllib.error.URLError as exc:
+        raise RuntimeError(str(exc))
 
 
 def main() -> None:
@@ -105,37 +105,39 @@ def main() -> None:
         print(f"  framework_version: {args.framework_version}")
         return
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_dir = Path(tmpdir) / "repo"
-        clone_url = f"https://{args.token}@github.com/{args.repo}.git"
-        res = run(["git", "clone", "--depth", "1", clone_url, str(repo_dir)])
-        if res.returncode != 0:
-            raise RuntimeError(res.stderr or res.stdout)
-
-        res = run(["git", "checkout", "-b", branch], cwd=repo_dir)
-        if res.returncode != 0:
-            raise RuntimeError(res.stderr or res.stdout)
-
-        dest = repo_dir / report_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(zip_path, dest)
-
-        res = run(["git", "add", str(report_path)], cwd=repo_dir)
-        if res.returncode != 0:
-            raise RuntimeError(res.stderr or res.stdout)
-
-        commit_msg = f"Add report {run_id} from {args.host_id}"
-        res = run(["git", "commit", "-m", commit_msg], cwd=repo_dir)
-        if res.returncode != 0:
-            raise RuntimeError(res.stderr or res.stdout)
+    api_base = f"https://api.github.com/repos/{args.repo}"
 
-        res = run(["git", "push", "-u", "origin", branch], cwd=repo_dir)
-        if res.returncode != 0:
-            raise RuntimeError(res.stderr or res.stdout)
+    # Two REST round-trips replace the old clone/checkout/commit/push
+    # pipeline: branch the base ref, then upload the bundle through the
+    # Contents API. No working copy ever touches disk.
+    base_ref = json.loads(
+        github_request(args.token, "GET", f"{api_base}/git/ref/heads/{args.base}")
+    )
+    try:
+        github_request(
+            args.token,
+            "POST",
+            f"{api_base}/git/refs",
+            {"ref": f"refs/heads/{branch}", "sha": base_ref["object"]["sha"]},
+        )
+    except RuntimeError as exc:
+        # The branch can survive an earlier partial publish; reuse it.
+        if "already exists" not in str(exc).lower():
+            raise
+
+    github_request(
+        args.token,
+        "PUT",
+        f"{api_base}/contents/{report_path.as_posix()}",
+        {
+            "message": f"Add report {run_id} from {args.host_id}",
+            "content": base64.b64encode(zip_path.read_bytes()).decode("ascii"),
+            "branch": branch,
+        },
+    )
 
     pr_url = None
     issue_url = None
-    api_base = f"https://api.github.com/repos/{args.repo}"
     report_body = "\n".join(
         [
             "## Report Metadata",
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import argparse
 import os
+import re
 import subprocess
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -18,24 +20,67 @@ def truthy(value: str | None) -> bool:
     return value.strip().lower() in ("1", "true", "yes", "on")
 
 
+@dataclass(frozen=True)
+class EnvCfg:
+    """Environment knobs, parsed once instead of ad hoc at each use."""
+
+    stall_timeout: int
+    watch_poll: float
+    status_interval: int
+    stall_kill: bool
+    resume: bool
+    skip_discovery: bool
+
+    @classmethod
+    def from_env(cls) -> "EnvCfg":
+        return cls(
+            stall_timeout=int(os.getenv("FRAMEWORK_STALL_TIMEOUT", "900")),
+            watch_poll=float(os.getenv("FRAMEWORK_WATCH_POLL", "2")),
+            status_interval=int(os.getenv("FRAMEWORK_STATUS_INTERVAL", "10")),
+            stall_kill=truthy(os.getenv("FRAMEWORK_STALL_KILL", "1")),
+            resume=truthy(os.getenv("FRAMEWORK_RESUME", "1")),
+            skip_discovery=truthy(os.getenv("FRAMEWORK_SKIP_DISCOVERY")),
+        )
+
+
+_latest_summary_cache: dict = {}
+
+
 def latest_summary(phase: str) -> Path | None:
     docs_dir = ROOT / "docs"
     if not docs_dir.exists():
         return None
-    candidates = sorted(docs_dir.glob(f"orchestrator-run-summary-{phase}-*.md"), key=lambda p: p.stat().st_mtime)
-    return candidates[-1] if candidates else None
+    # Resume checks probe repeatedly; key on the directory mtime so a
+    # repeat costs one stat until docs/ actually gains a file.
+    key = (phase, docs_dir.stat().st_mtime_ns)
+    if key in _latest_summary_cache:
+        return _latest_summary_cache[key]
+    # Only the newest summary matters: track the max mtime in one pass
+    # rather than sorting every candidate.
+    prefix = f"orchestrator-run-summary-{phase}-"
+    best = None
+    best_mtime = -1
+    with os.scandir(docs_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix) or not entry.name.endswith(".md"):
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if mtime > best_mtime:
+                best_mtime = mtime
+                best = entry.path
+    result = Path(best) if best else None
+    _latest_summary_cache[key] = result
+    return result
+
+
+# One pass over the summary instead of two substring scans plus three
+# checks per line; the $ anchor stands in for the old per-line endswith.
+_SUMMARY_FAIL_RE = re.compile(r"- Error:|PAUSED|: FAIL[ \t]*$|FAIL \(|BLOCKED", re.MULTILINE)
 
 
 def summary_success(path: Path) -> bool:
     text = path.read_text(encoding="utf-8", errors="ignore")
-    if "- Error:" in text:
-        return False
-    if "PAUSED" in text:
-        return False
-    for line in text.splitlines():
-        if line.strip().endswith(": FAIL") or "FAIL (" in line or "BLOCKED" in line:
-            return False
-    return True
+    return _SUMMARY_FAIL_RE.search(text) is None
 
 
 def phase_completed(phase: str) -> bool:
@@ -45,7 +90,7 @@ def phase_completed(phase: str) -> bool:
     return summary_success(summary)
 
 
-def run_phase(config: Path, phase: str, logs_dir: Path) -> int:
+def run_phase(config: Path, phase: str, logs_dir: Path, env_cfg: EnvCfg) -> int:
     cmd = [sys.executable, str(ORCH), "--config", str(config), "--phase", phase]
     env = os.environ.copy()
     proc = subprocess.Popen(cmd, env=env)
@@ -61,18 +106,29 @@ def run_phase(config: Path, phase: str, logs_dir: Path) -> int:
         "--logs-dir",
         str(logs_dir),
         "--stall-timeout",
-        str(int(os.getenv("FRAMEWORK_STALL_TIMEOUT", "900"))),
+        str(env_cfg.stall_timeout),
         "--poll-interval",
-        str(float(os.getenv("FRAMEWORK_WATCH_POLL", "2"))),
+        str(env_cfg.watch_poll),
         "--status-interval",
-        str(int(os.getenv("FRAMEWORK_STATUS_INTERVAL", "10"))),
+        str(env_cfg.status_interval),
     ]
-    if os.getenv("FRAMEWORK_STALL_KILL", "1").strip().lower() in ("1", "true", "yes", "on"):
+    if env_cfg.stall_kill:
         watch_cmd.append("--kill-on-stall")
     watcher = subprocess.Popen(watch_cmd)
 
     code = proc.wait()
-    watcher.wait(timeout=5)
+    # The watcher notices orchestrator exit on its own (it waits on the
+    # orchestrator's pidfd); give it a grace period, then reap it instead
+    # of letting TimeoutExpired escape and mask the phase's exit code.
+    try:
+        watcher.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        watcher.terminate()
+        try:
+            watcher.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            watcher.kill()
+            watcher.wait()
     try:
         pid_path.unlink()
     except FileNotFoundError:
@@ -80,30 +136,32 @@ def run_phase(config: Path, phase: str, logs_dir: Path) -> int:
     return code
 
 
-def determine_mode(default_phase: str | None) -> list[str]:
+_MODE_IGNORE = {
+    "framework",
+    "framework.zip",
+    "install-fr.sh",
+    "AGENTS.md",
+    "AGENTS.override.md",
+    ".git",
+    ".gitignore",
+    ".DS_Store",
+}
+
+
+def determine_mode(default_phase: str | None, env_cfg: EnvCfg) -> list[str]:
     if default_phase:
         return [default_phase]
-    # auto-detect empty host vs legacy
-    root = Path.cwd()
-    ignore = {
-        "framework",
-        "framework.zip",
-        "install-fr.sh",
-        "AGENTS.md",
-        "AGENTS.override.md",
-        ".git",
-        ".gitignore",
-        ".DS_Store",
-    }
-    for entry in root.iterdir():
-        if entry.name in ignore:
-            continue
-        if entry.name.startswith("install-fr-") and entry.name.endswith(".sh"):
-            continue
-        phases = ["legacy", "discovery"]
-        if truthy(os.getenv("FRAMEWORK_SKIP_DISCOVERY")):
-            phases = ["legacy"]
-        return phases
+    # auto-detect empty host vs legacy; scandir stops at the first
+    # non-ignored entry instead of listing the whole directory.
+    with os.scandir(Path.cwd()) as entries:
+        for entry in entries:
+            if entry.name in _MODE_IGNORE:
+                continue
+            if entry.name.startswith("install-fr-") and entry.name.endswith(".sh"):
+                continue
+            if env_cfg.skip_discovery:
+                return ["legacy"]
+            return ["legacy", "discovery"]
     return ["discovery"]
 
 
@@ -116,8 +174,9 @@ def main() -> int:
     config = Path(args.config).resolve()
     logs_dir = Path("framework/logs").resolve()
 
-    phases = determine_mode(args.phase)
-    resume = os.getenv("FRAMEWORK_RESUME", "1").strip().lower() in ("1", "true", "yes", "on")
+    env_cfg = EnvCfg.from_env()
+    phases = determine_mode(args.phase, env_cfg)
+    resume = env_cfg.resume
 
     discovery_ok = False
     for phase in phases:
@@ -125,7 +184,7 @@ def main() -> int:
             print(f"[RESUME] skip {phase} (already completed)")
             continue
         print(f"[PHASE] starting {phase}")
-        code = run_phase(config, phase, logs_dir)
+        code = run_phase(config, phase, logs_dir, env_cfg)
         if code == 2 and phase == "discovery":
             print("[PAUSED] discovery interview paused. Re-run ./install-fr.sh to continue.")
             return 0
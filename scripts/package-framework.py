@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import argparse
 import base64
+import hashlib
+import os
 import shutil
 import subprocess
 import time
@@ -31,22 +33,42 @@ def git_short():
     return None
 
 
-def should_skip(path: Path) -> bool:
-    rel = path.relative_to(FRAMEWORK_DIR)
-    for part in rel.parts:
-        if part in EXCLUDE_DIRS:
-            return True
-    if path.name in EXCLUDE_NAMES:
-        return True
-    return False
+def iter_framework_files():
+    # Prune excluded directories while walking so their subtrees are
+    # never listed, instead of rglob'ing everything and filtering paths
+    # one by one afterwards. Sorted for a deterministic archive order.
+    for dirpath, dirnames, filenames in os.walk(FRAMEWORK_DIR):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDE_DIRS)
+        base = Path(dirpath)
+        for name in sorted(filenames):
+            if name in EXCLUDE_NAMES:
+                continue
+            yield base / name
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Package framework/ into framework.zip")
     parser.add_argument("--out", default=str(DEFAULT_OUT), help="Output zip path")
     parser.add_argument("--version", help="Override version string")
+    parser.add_argument(
+        "--compression",
+        choices=["deflated", "stored", "zstd"],
+        default="deflated",
+        help="Zip compression (zstd needs Python 3.14+ on both ends)",
+    )
     args = parser.parse_args()
 
+    if args.compression == "zstd":
+        # Opt-in only: the installer unpacks with the host machine's own
+        # Python, which must also be 3.14+ to read zstd entries.
+        compression = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if compression is None:
+            raise SystemExit("zstd compression requires Python 3.14+ zipfile")
+    elif args.compression == "stored":
+        compression = zipfile.ZIP_STORED
+    else:
+        compression = zipfile.ZIP_DEFLATED
+
     if not FRAMEWORK_DIR.exists():
         raise SystemExit(f"Missing framework dir: {FRAMEWORK_DIR}")
 
@@ -60,14 +82,39 @@ def main() -> None:
         VERSION_FILE.write_text(f"{version}\n", encoding="utf-8")
 
     out_path = Path(args.out)
-    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in FRAMEWORK_DIR.rglob("*"):
-            if path.is_dir():
-                continue
-            if should_skip(path):
-                continue
+    # Prefetch file contents on a thread pool so disk reads overlap the
+    # (GIL-releasing) deflate work in the writer loop.
+    from concurrent.futures import ThreadPoolExecutor
+
+    files = list(iter_framework_files())
+
+    # Cheap tree fingerprint (names + mtimes + sizes, no reads): when it
+    # matches the last build, both the zip and the installer rewrite are
+    # already up to date and the whole invocation is a no-op.
+    tree_hash = hashlib.blake2b(digest_size=16)
+    for path in files:
+        st = path.stat()
+        tree_hash.update(
+            f"{path.relative_to(ROOT).as_posix()}:{st.st_mtime_ns}:{st.st_size}\n".encode()
+        )
+    tree_hash.update(args.compression.encode())
+    digest = tree_hash.hexdigest()
+    hash_path = out_path.with_name(out_path.name + ".hash")
+    if (
+        out_path.exists()
+        and hash_path.exists()
+        and hash_path.read_text(encoding="utf-8", errors="ignore").strip() == digest
+    ):
+        print(f"Framework unchanged, keeping: {out_path}")
+        print(f"Version: {version}")
+        return
+    with zipfile.ZipFile(out_path, "w", compression=compression) as zf, \
+            ThreadPoolExecutor(max_workers=min(8, max(1, len(files)))) as ex:
+        for path, data in zip(files, ex.map(Path.read_bytes, files)):
             arcname = path.relative_to(ROOT).as_posix()
-            zf.write(path, arcname)
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            info.compress_type = compression
+            zf.writestr(info, data)
 
     print(f"Framework packaged: {out_path}")
     print(f"Version: {version}")
@@ -75,18 +122,34 @@ def main() -> None:
     if INSTALLER_PATH.exists():
         content_lines = INSTALLER_PATH.read_text(encoding="utf-8", errors="ignore").splitlines()
         if EMBED_BEGIN in content_lines and EMBED_END in content_lines:
-            payload = base64.b64encode(out_path.read_bytes()).decode("ascii")
-            chunked = [payload[i:i + 76] for i in range(0, len(payload), 76)]
             start_idx = content_lines.index(EMBED_BEGIN)
             end_idx = content_lines.index(EMBED_END)
             if end_idx > start_idx:
-                new_lines = content_lines[:start_idx + 1] + chunked + content_lines[end_idx:]
-                INSTALLER_PATH.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+                tmp_path = INSTALLER_PATH.with_name(INSTALLER_PATH.name + ".tmp")
+                with tmp_path.open("w", encoding="utf-8") as out:
+                    out.write("\n".join(content_lines[:start_idx + 1]) + "\n")
+                    # Encode in 57 KiB blocks (57 input bytes make one
+                    # 76-char base64 line, so block boundaries align)
+                    # instead of materializing the whole payload.
+                    with out_path.open("rb") as zip_in:
+                        while True:
+                            block = zip_in.read(57 * 1024)
+                            if not block:
+                                break
+                            encoded = base64.b64encode(block).decode("ascii")
+                            for i in range(0, len(encoded), 76):
+                                out.write(encoded[i:i + 76])
+                                out.write("\n")
+                    out.write("\n".join(content_lines[end_idx:]) + "\n")
+                shutil.copymode(INSTALLER_PATH, tmp_path)
+                tmp_path.replace(INSTALLER_PATH)
                 print(f"Installer updated with embedded zip: {INSTALLER_PATH}")
                 versioned = ROOT / f"install-fr-{version}.sh"
                 shutil.copy2(INSTALLER_PATH, versioned)
                 print(f"Versioned installer: {versioned}")
 
+    hash_path.write_text(digest + "\n", encoding="utf-8")
+
 
 if __name__ == "__main__":
     main()